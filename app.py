@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
 from data_manager import CareerDataManager
 from visualizer import CareerVisualizer
 
@@ -10,23 +13,12 @@ st.set_page_config(
     layout="wide"
 )
 
-# 간단한 CSS
-st.markdown("""
-    <style>
-    .big-title {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #2c3e50;
-        margin-bottom: 0.5rem;
-    }
-    .stButton>button {
-        width: 100%;
-        font-size: 1.1rem;
-        padding: 0.5rem;
-        border-radius: 8px;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# 간단한 CSS (테마로 표현할 수 없는 규칙만, 파일은 프로세스당 한 번 읽음)
+@st.cache_data
+def _load_css():
+    return (Path(__file__).parent / "assets" / "styles.css").read_text(encoding="utf-8")
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 # 데이터 관리자 초기화
 @st.cache_resource
@@ -35,171 +27,316 @@ def get_managers():
 
 data_manager, visualizer = get_managers()
 
+# 검색어 정규화 (탭마다 입력한 검색어가 같은 캐시 항목을 쓰도록)
+def canon(q: str) -> str:
+    return q.strip().lower()
+
+# 검색 결과 캐시 (같은 검색어는 재실행 시 다시 조회하지 않음)
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def cached_search(q: str, field: Optional[str] = None, limit: Optional[int] = None):
+    return data_manager.search_jobs_by_keyword(q, field, limit)
+
+# 검색어별 선택 목록 캐시 (선택지 튜플, 직업명 → 코드)
+@st.cache_data
+def cached_job_options(q: str):
+    codes = {job['name']: job['code'] for job in cached_search(q, limit=5)}
+    return tuple(codes), codes
+
+# 직업 상세 정보 캐시 (읽기 전용 매핑은 직렬화할 수 없어 dict로 복사)
+@st.cache_data(show_spinner=False)
+def cached_details(code: str):
+    return dict(data_manager.get_job_details(code))
+
+# 여러 직업 상세 정보 일괄 캐시
+@st.cache_data
+def cached_jobs_details(codes_tuple: tuple):
+    return [dict(job) for job in data_manager.get_jobs_details(list(codes_tuple))]
+
+# 비교 테이블/차트 캐시 (선택된 직업 조합이 같으면 다시 만들지 않음)
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_compare(codes_tuple: tuple):
+    return data_manager.compare_jobs(list(codes_tuple), cached_jobs_details(codes_tuple))
+
+@st.cache_data
+def cached_salary_fig(codes_tuple: tuple):
+    return visualizer.create_salary_distribution(cached_jobs_details(codes_tuple))
+
+# 진로 경로 데이터/차트 캐시
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_path(code: str):
+    return data_manager.get_career_path_data(code)
+
+@st.cache_data(show_spinner=False)
+def cached_path_fig(code: str):
+    return visualizer.create_career_path_network(cached_path(code))
+
+# 상세 보기 핵심 지표 (표시 이름, 직업 정보 키)
+@dataclass(frozen=True, slots=True)
+class MetricSpec:
+    label: str
+    key: str
+
+DETAIL_METRICS = (
+    MetricSpec("💰 연봉", "salary_range"),
+    MetricSpec("📈 전망", "outlook"),
+    MetricSpec("📊 성장률", "growth_rate"),
+    MetricSpec("🎓 취업률", "employment_rate")
+)
+
+# 인기 직업 (상세 정보를 미리 캐시에 올려 둠)
+@dataclass(frozen=True, slots=True)
+class PopularJob:
+    name: str
+    code: str
+
+POPULAR_JOBS = (
+    PopularJob("🤖 AI 엔지니어", "AI001"),
+    PopularJob("💼 경영 컨설턴트", "BIZ001"),
+    PopularJob("🧠 임상심리사", "PSY001"),
+    PopularJob("🎨 UX/UI 디자이너", "ART001"),
+    PopularJob("🎬 크리에이터", "MDA001")
+)
+
+@st.cache_resource
+def _prewarm():
+    return [cached_details(pj.code) for pj in POPULAR_JOBS]
+
+_prewarm()
+
+# 직업 찾기 결과 표에 보여줄 최대 직업 수
+SEARCH_RESULT_LIMIT = 10
+
+# 세션별로 보관할 차트 개수 (오래 쓰지 않은 차트부터 제거)
+SESSION_FIGURE_LIMIT = 8
+
+# 진로 경로 검색어 최소 길이 (너무 짧은 검색어는 조회하지 않음)
+MIN_QUERY_LEN = 2
+
+# 고정 문구 (재실행마다 문자열을 새로 만들지 않음)
+STEP_HINT = "준비사항을 차근차근 진행하세요"
+FOOTER_HTML = """
+<div style='text-align: center; color: #666; padding: 1rem;'>
+    <p>💡 경기도 진로전담교사 지원 시스템</p>
+</div>
+"""
+
+# 직업 상세 패널 (같은 직업이면 본문을 다시 실행하지 않고 캐시된 요소를 재생)
+@st.cache_data(show_spinner=False)
+def render_detail(code: str) -> bool:
+    job_data = cached_details(code)
+    if not job_data:
+        return False
+    
+    st.markdown("---")
+    st.markdown(f"# {job_data['job_name']}")
+    
+    # 핵심 정보
+    cols = st.columns(len(DETAIL_METRICS))
+    for col, spec in zip(cols, DETAIL_METRICS):
+        with col:
+            st.metric(spec.label, job_data.get(spec.key, 'N/A'))
+    
+    st.markdown("---")
+    
+    # 상세 정보
+    st.markdown("### 📝 직업 설명")
+    st.info(job_data.get('description', ''))
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🔧 주요 업무")
+        st.markdown("\n".join(f"- {task}" for task in job_data.get('main_tasks', [])))
+    
+    with col2:
+        st.markdown("### 💪 필요한 능력")
+        st.markdown("\n".join(f"- {skill}" for skill in job_data.get('required_skills', [])[:5]))
+    
+    return True
+
 # 세션 상태 초기화
 if 'selected_job_code' not in st.session_state:
     st.session_state.selected_job_code = None
 if 'selected_jobs_for_comparison' not in st.session_state:
-    st.session_state.selected_jobs_for_comparison = []
+    st.session_state.selected_jobs_for_comparison = {}  # 순서 유지 집합 (dict 키)
+
+# 세션별 결과 캐시 (직업 코드 → 결과)
+def session_cached(cache_name: str, code, loader):
+    cache = st.session_state.setdefault(cache_name, {})
+    if code not in cache:
+        cache[code] = loader(code)
+    return cache[code]
+
+# 세션별 차트 캐시 (Figure 대신 직렬화된 dict를 보관해 재실행마다 역직렬화하지 않음)
+# 최근 SESSION_FIGURE_LIMIT개만 남겨 세션 메모리가 계속 늘지 않도록 함
+def session_figure(cache_name: str, key, builder):
+    cache = st.session_state.setdefault(cache_name, {})
+    if key in cache:
+        cache[key] = cache.pop(key)  # 최근 사용으로 이동
+    else:
+        cache[key] = builder(key).to_dict()
+        while len(cache) > SESSION_FIGURE_LIMIT:
+            cache.pop(next(iter(cache)))
+    return cache[key]
+
+# 버튼 콜백 (상태만 바꾸고 Streamlit의 기본 재실행에 맡김)
+def _pick(code):
+    st.session_state.selected_job_code = code
+
+def _add(codes):
+    for code in codes:
+        st.session_state.selected_jobs_for_comparison.setdefault(code, None)
+
+def _remove(code):
+    st.session_state.selected_jobs_for_comparison.pop(code, None)
+
+def _reset_comparison():
+    st.session_state.selected_jobs_for_comparison = {}
 
 # 메인 타이틀
 st.markdown('<p class="big-title">🎯 진로 탐색 플랫폼</p>', unsafe_allow_html=True)
 st.markdown("### 미래 직업을 쉽고 빠르게 찾아보세요")
 st.divider()
 
-# 탭 메뉴
-tab1, tab2, tab3, tab4 = st.tabs(["🔍 직업 찾기", "📊 비교하기", "🎓 진학 정보", "🗺️ 진로 경로"])
+# 메뉴 (선택된 메뉴의 코드만 실행)
+PAGES = ("🔍 직업 찾기", "📊 비교하기", "🎓 진학 정보", "🗺️ 진로 경로")
+page = st.radio("메뉴", PAGES, horizontal=True, label_visibility="collapsed", key="page")
 
 # 탭 1: 직업 찾기
-with tab1:
+@st.fragment
+def page_search():
     st.markdown("## 어떤 직업을 찾고 계신가요?")
     
-    # 검색창
-    col1, col2 = st.columns([4, 1])
-    with col1:
-        search_query = st.text_input(
-            "직업 검색",
-            placeholder="예: AI 엔지니어, 경영 컨설턴트",
-            label_visibility="collapsed"
-        )
-    with col2:
-        search_button = st.button("🔍 검색", use_container_width=True)
+    # 검색창 (제출할 때만 검색어 반영)
+    with st.form("search_form", clear_on_submit=False, border=False):
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            search_query = st.text_input(
+                "직업 검색",
+                placeholder="예: AI 엔지니어, 경영 컨설턴트",
+                label_visibility="collapsed"
+            )
+        with col2:
+            search_button = st.form_submit_button("🔍 검색", use_container_width=True)
     
     # 인기 직업 버튼
     st.markdown("#### 또는 인기 직업 바로 보기")
     cols = st.columns(5)
-    popular_jobs = [
-        ("🤖 AI 엔지니어", "AI001"),
-        ("💼 경영 컨설턴트", "BIZ001"),
-        ("🧠 임상심리사", "PSY001"),
-        ("🎨 UX/UI 디자이너", "ART001"),
-        ("🎬 크리에이터", "MDA001")
-    ]
-    
-    for idx, (job_name, job_code) in enumerate(popular_jobs):
+    for idx, pj in enumerate(POPULAR_JOBS):
         with cols[idx]:
-            if st.button(job_name, key=f"pop_{job_code}"):
-                st.session_state.selected_job_code = job_code
-                st.rerun()
+            st.button(pj.name, key=f"pop_{pj.code}", use_container_width=True, on_click=_pick, args=(pj.code,))
     
     # 검색 결과
-    if search_query or search_button:
-        results = data_manager.search_jobs_by_keyword(search_query)
+    query = canon(search_query)
+    if search_button and not query:
+        st.info("검색어를 입력하세요")
+    elif query:
+        # 한 개 더 조회해 표에 다 담지 못한 결과가 있는지 확인
+        results = cached_search(query, limit=SEARCH_RESULT_LIMIT + 1)
+        truncated = len(results) > SEARCH_RESULT_LIMIT
+        results = results[:SEARCH_RESULT_LIMIT]
         
         if results:
-            st.success(f"✅ {len(results)}개의 직업을 찾았습니다!")
+            if truncated:
+                st.success(f"✅ {SEARCH_RESULT_LIMIT}개 이상의 직업을 찾았습니다!")
+                st.caption(f"관련도 상위 {SEARCH_RESULT_LIMIT}개만 표시합니다. 검색어를 더 구체적으로 입력해 보세요.")
+            else:
+                st.success(f"✅ {len(results)}개의 직업을 찾았습니다!")
             
-            for job in results[:10]:
-                col1, col2, col3 = st.columns([3, 1, 1])
-                with col1:
-                    st.markdown(f"### {job['name']}")
-                    st.caption(f"분야: {job.get('field', '일반')} | 전망: {job.get('growth', '보통')}")
-                with col2:
-                    if st.button("📖 상세", key=f"detail_{job['code']}"):
-                        st.session_state.selected_job_code = job['code']
-                        st.rerun()
-                with col3:
-                    if st.button("➕ 비교", key=f"add_{job['code']}"):
-                        if job['code'] not in st.session_state.selected_jobs_for_comparison:
-                            st.session_state.selected_jobs_for_comparison.append(job['code'])
-                            st.success("추가됨!")
-                st.divider()
+            results_df = pd.DataFrame({
+                '선택': [False] * len(results),
+                '직업명': [job['name'] for job in results],
+                '분야': [job.get('field', '일반') for job in results],
+                '전망': [job.get('growth', '보통') for job in results]
+            })
+            edited_df = st.data_editor(
+                results_df,
+                use_container_width=True,
+                hide_index=True,
+                disabled=['직업명', '분야', '전망'],
+                column_config={'선택': st.column_config.CheckboxColumn('선택', width='small')},
+                key="results_grid"
+            )
+            
+            # 체크한 행에 대한 동작
+            checked = [job for job, on in zip(results, edited_df['선택']) if on]
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button(
+                    "📖 상세 보기", key="detail_selected", disabled=not checked,
+                    on_click=_pick, args=(checked[0]['code'] if checked else None,)
+                )
+            with col2:
+                if st.button(
+                    "➕ 비교 추가", key="add_selected", disabled=not checked,
+                    on_click=_add, args=([job['code'] for job in checked],)
+                ):
+                    st.success("추가됨!")
+            if not checked:
+                st.caption("표에서 직업을 체크하세요")
         else:
             st.warning("검색 결과가 없습니다")
     
     # 선택된 직업 상세
     if st.session_state.selected_job_code:
-        job_data = data_manager.get_job_details(st.session_state.selected_job_code)
-        
-        if job_data:
-            st.markdown("---")
-            st.markdown(f"# {job_data['job_name']}")
-            
-            # 핵심 정보
-            cols = st.columns(4)
-            with cols[0]:
-                st.metric("💰 연봉", job_data.get('salary_range', 'N/A'))
-            with cols[1]:
-                st.metric("📈 전망", job_data.get('outlook', 'N/A'))
-            with cols[2]:
-                st.metric("📊 성장률", job_data.get('growth_rate', 'N/A'))
-            with cols[3]:
-                st.metric("🎓 취업률", job_data.get('employment_rate', 'N/A'))
-            
-            st.markdown("---")
-            
-            # 상세 정보
-            st.markdown("### 📝 직업 설명")
-            st.info(job_data.get('description', ''))
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("### 🔧 주요 업무")
-                for task in job_data.get('main_tasks', []):
-                    st.markdown(f"• {task}")
-            
-            with col2:
-                st.markdown("### 💪 필요한 능력")
-                for skill in job_data.get('required_skills', [])[:5]:
-                    st.markdown(f"• {skill}")
-            
-            if st.button("← 검색으로 돌아가기"):
-                st.session_state.selected_job_code = None
-                st.rerun()
+        if render_detail(st.session_state.selected_job_code):
+            st.button("← 검색으로 돌아가기", on_click=_pick, args=(None,))
 
 # 탭 2: 비교하기
-with tab2:
+@st.fragment
+def page_compare():
     st.markdown("## 직업 비교하기")
     
     if st.session_state.selected_jobs_for_comparison:
         st.success(f"📋 {len(st.session_state.selected_jobs_for_comparison)}개 직업 선택됨")
         
+        key = tuple(st.session_state.selected_jobs_for_comparison)
+        job_details = cached_jobs_details(key)
+        
         # 선택된 직업 표시
-        cols = st.columns(len(st.session_state.selected_jobs_for_comparison))
-        for idx, job_code in enumerate(st.session_state.selected_jobs_for_comparison):
-            job = data_manager.get_job_details(job_code)
-            with cols[idx]:
+        cols = st.columns(len(key))
+        for col, job_code, job in zip(cols, key, job_details):
+            with col:
                 st.markdown(f"**{job.get('job_name', '')}**")
-                if st.button("❌", key=f"remove_{job_code}"):
-                    st.session_state.selected_jobs_for_comparison.remove(job_code)
-                    st.rerun()
+                st.button("❌", key=f"remove_{job_code}", on_click=_remove, args=(job_code,))
         
-        if len(st.session_state.selected_jobs_for_comparison) >= 2:
+        if len(key) >= 2:
             st.markdown("---")
             
             # 비교 테이블
-            comparison_df = data_manager.compare_jobs(st.session_state.selected_jobs_for_comparison)
+            comparison_df = cached_compare(key)
             st.dataframe(comparison_df, use_container_width=True, hide_index=True)
             
             # 연봉 비교 차트
-            job_details = [data_manager.get_job_details(code) for code in st.session_state.selected_jobs_for_comparison]
             st.plotly_chart(
-                visualizer.create_salary_distribution(job_details),
-                use_container_width=True
+                session_figure('_salary_fig_cache', key, cached_salary_fig),
+                use_container_width=True,
+                key="salary_chart"
             )
             
-            if st.button("🔄 초기화"):
-                st.session_state.selected_jobs_for_comparison = []
-                st.rerun()
+            st.button("🔄 초기화", on_click=_reset_comparison)
         else:
             st.info("💡 최소 2개 이상의 직업을 선택하세요")
     else:
         st.info("💡 '직업 찾기' 탭에서 비교할 직업을 추가하세요")
 
 # 탭 3: 진학 정보
-with tab3:
+@st.fragment
+def page_education():
     st.markdown("## 진학 정보")
     
-    job_search = st.text_input("직업 검색", placeholder="예: AI 엔지니어", key="major_search")
+    with st.form("major_search_form", clear_on_submit=False):
+        job_search = st.text_input("직업 검색", placeholder="예: AI 엔지니어", key="major_search")
+        st.form_submit_button("🔍 검색")
     
-    if job_search:
-        jobs = data_manager.search_jobs_by_keyword(job_search)
-        if jobs:
-            job_options = {job['name']: job['code'] for job in jobs[:5]}
-            selected_job = st.selectbox("직업 선택", list(job_options.keys()))
+    major_query = canon(job_search)
+    if major_query:
+        job_labels, job_options = cached_job_options(major_query)
+        if job_labels:
+            selected_job = st.selectbox("직업 선택", job_labels)
             
             if selected_job:
-                mapping = data_manager.get_job_to_major_mapping(job_options[selected_job])
+                mapping = session_cached('_major_cache', job_options[selected_job], data_manager.get_job_to_major_mapping)
                 
                 st.markdown(f"### {selected_job} 진학 정보")
                 
@@ -208,51 +345,61 @@ with tab3:
                 with col1:
                     st.markdown("#### 🏫 고등학교")
                     st.markdown("**권장 선택과목**")
-                    for subject in mapping.get('high_school_subjects', []):
-                        st.success(subject)
+                    st.success("\n".join(f"- {subject}" for subject in mapping.get('high_school_subjects', [])))
                 
                 with col2:
                     st.markdown("#### 🎓 대학 전공")
-                    for major in mapping.get('related_majors', [])[:5]:
-                        st.info(major)
+                    st.info("\n".join(f"- {major}" for major in mapping.get('related_majors', [])[:5]))
                 
                 with col3:
                     st.markdown("#### 📜 학력 요구")
                     st.warning(mapping.get('required_education', ''))
 
 # 탭 4: 진로 경로
-with tab4:
+@st.fragment
+def page_path():
     st.markdown("## 진로 경로")
     
-    job_search_path = st.text_input("직업 검색", placeholder="진로 경로를 볼 직업", key="path_search")
+    with st.form("path_search_form", clear_on_submit=False):
+        job_search_path = st.text_input("직업 검색", placeholder="진로 경로를 볼 직업", key="path_search")
+        st.form_submit_button("🔍 검색")
     
-    if job_search_path:
-        jobs = data_manager.search_jobs_by_keyword(job_search_path)
-        if jobs:
-            job_options = {job['name']: job['code'] for job in jobs[:5]}
-            selected_job_name = st.selectbox("직업 선택", list(job_options.keys()), key="path_select")
+    path_query = canon(job_search_path)
+    if 0 < len(path_query) < MIN_QUERY_LEN:
+        st.caption(f"{MIN_QUERY_LEN}글자 이상 입력하세요")
+    elif path_query:
+        job_labels, job_options = cached_job_options(path_query)
+        if job_labels:
+            selected_job_name = st.selectbox("직업 선택", job_labels, key="path_select")
             
             if selected_job_name:
-                path_data = data_manager.get_career_path_data(job_options[selected_job_name])
+                selected_code = job_options[selected_job_name]
+                # 같은 직업이면 세션에 보관한 경로 데이터를 그대로 사용 (캐시 역직렬화 생략)
+                if st.session_state.get('path_code') != selected_code:
+                    st.session_state.path_code = selected_code
+                    st.session_state.path_data = cached_path(selected_code)
+                path_data = st.session_state.path_data
                 
                 st.markdown(f"### {selected_job_name} 되는 법")
                 
                 # 경로 시각화
                 st.plotly_chart(
-                    visualizer.create_career_path_network(path_data),
-                    use_container_width=True
+                    session_figure('_path_fig_cache', selected_code, cached_path_fig),
+                    use_container_width=True,
+                    config={'displayModeBar': False},
+                    key="path_chart"
                 )
                 
                 # 단계별 설명
                 st.markdown("### 📋 단계별 준비")
                 for idx, step in enumerate(path_data.get('steps', []), 1):
                     with st.expander(f"**{idx}단계: {step}**"):
-                        st.markdown("준비사항을 차근차근 진행하세요")
+                        st.markdown(STEP_HINT)
+
+# 선택된 메뉴 실행 (메뉴 안의 상호작용은 해당 프래그먼트만 다시 실행)
+PAGE_VIEWS = dict(zip(PAGES, (page_search, page_compare, page_education, page_path)))
+PAGE_VIEWS[page]()
 
 # 푸터
 st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #666; padding: 1rem;'>
-    <p>💡 경기도 진로전담교사 지원 시스템</p>
-</div>
-""", unsafe_allow_html=True)
+st.html(FOOTER_HTML)
@@ -0,0 +1,78 @@
+"""
+data_manager 모듈 테스트
+"""
+
+import unittest
+from unittest import mock
+
+import requests
+
+import data_manager
+from data_manager import FAIL_CACHE_TTL, RETRY_AFTER_MAX, WorkNetAPI
+
+
+def _response(status: int, headers: dict = None) -> requests.Response:
+    """상태 코드와 헤더만 있는 응답 생성"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = b'{}'
+    return response
+
+
+class RetryAfterTest(unittest.TestCase):
+    """실패 캐시가 서버의 Retry-After를 따르는지 확인"""
+
+    def setUp(self):
+        self.api = WorkNetAPI()
+        self.addCleanup(self.api.close)
+        self.endpoint = "http://example.invalid/jobs"
+        self.key = (self.endpoint, ())
+
+    def _request_with(self, response: requests.Response):
+        with mock.patch.object(self.api.session, 'get', return_value=response) as get:
+            with self.assertRaises(requests.HTTPError):
+                self.api._request(self.endpoint, {})
+        return get
+
+    def _fail_ttl(self) -> float:
+        _, ttl, _ = self.api._fail_cache._data[self.key]
+        return ttl
+
+    def test_429_retry_after_sets_fail_ttl(self):
+        self._request_with(_response(429, {'Retry-After': '120'}))
+        self.assertEqual(self._fail_ttl(), 120)
+
+    def test_skips_calls_until_retry_after_expires(self):
+        now = 1000.0
+        with mock.patch.object(data_manager.time, 'monotonic', side_effect=lambda: now):
+            self._request_with(_response(429, {'Retry-After': '120'}))
+
+            # 기본 실패 시간(60초)이 지나도 Retry-After 동안은 호출하지 않음
+            now += FAIL_CACHE_TTL + 30
+            with mock.patch.object(self.api.session, 'get') as get:
+                with self.assertRaises(RuntimeError):
+                    self.api._request(self.endpoint, {})
+            get.assert_not_called()
+
+            # Retry-After가 지나면 다시 호출
+            now += 60
+            with mock.patch.object(self.api.session, 'get', return_value=_response(200)) as get:
+                self.assertEqual(self.api._request(self.endpoint, {}), {})
+            get.assert_called_once()
+
+    def test_retry_after_is_capped(self):
+        self._request_with(_response(503, {'Retry-After': '86400'}))
+        self.assertEqual(self._fail_ttl(), RETRY_AFTER_MAX)
+
+    def test_missing_or_invalid_retry_after_uses_default(self):
+        self._request_with(_response(429))
+        self.assertEqual(self._fail_ttl(), FAIL_CACHE_TTL)
+
+        self.api._fail_cache._data.clear()
+        self._request_with(_response(429, {'Retry-After': 'soon'}))
+        self.assertEqual(self._fail_ttl(), FAIL_CACHE_TTL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+visualizer 모듈 테스트
+"""
+
+import unittest
+
+import plotly.graph_objects as go
+
+from visualizer import CareerVisualizer
+
+
+class ExtendTraceTest(unittest.TestCase):
+    """점 추가 후 잘라낼 때 점별 속성의 짝이 유지되는지 확인"""
+
+    def setUp(self):
+        self.visualizer = CareerVisualizer()
+        jobs = [{'name': 'a', 'growth': '높음'}, {'name': 'b', 'growth': '중'}, {'name': 'c', 'growth': '낮음'}]
+        # 캐시된 Figure는 공유되므로 복사해서 사용
+        self.fig = go.Figure(self.visualizer.create_growth_comparison(jobs))
+        self.trace = self.fig.data[0]
+
+    def assert_aligned(self):
+        n = len(self.trace.x)
+        for values in (self.trace.y, self.trace.marker.color, self.trace.text):
+            self.assertEqual(len(values), n)
+
+    def test_append_pads_per_point_arrays(self):
+        self.visualizer.append_point(self.fig, 0, 'new', 3)
+
+        self.assertEqual(list(self.trace.x), ['a', 'b', 'c', 'new'])
+        self.assert_aligned()
+        self.assertIsNone(self.trace.text[-1])
+
+    def test_append_then_trim_keeps_pairs(self):
+        self.visualizer.append_point(self.fig, 0, 'new', 3)
+        self.visualizer.extend_growth_comparison(self.fig, [{'name': 'q', 'growth': '높음'}], max_points=2)
+
+        self.assertEqual(list(self.trace.x), ['new', 'q'])
+        self.assertEqual(list(self.trace.y), [3, 4])
+        self.assertEqual(self.trace.marker.color[-1], 4)
+        self.assertEqual(list(self.trace.text), [None, '높음'])
+        self.assert_aligned()
+
+    def test_append_with_window_trims_styles(self):
+        self.visualizer.append_point(self.fig, 0, 'new', 3, max_points=3)
+
+        self.assertEqual(list(self.trace.x), ['b', 'c', 'new'])
+        self.assertEqual(list(self.trace.text), ['중', '낮음', None])
+        self.assertEqual(list(self.trace.marker.color[:2]), [2, 1])
+        self.assert_aligned()
+
+    def test_scalar_style_is_kept(self):
+        fig = go.Figure(go.Bar(x=[1, 2], y=[3, 4], marker=dict(color='red')))
+        self.visualizer.append_point(fig, 0, 3, 5, max_points=2)
+
+        self.assertEqual(list(fig.data[0].x), [2, 3])
+        self.assertEqual(fig.data[0].marker.color, 'red')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,104 +1,332 @@
 """
 진로 데이터 시각화 모듈
 직업 정보, 진로 경로, 비교 분석 등을 시각화
+
+트레이스 데이터는 dtype을 지정한 NumPy 배열로 넘긴다. Plotly는 배열을 원소별
+검사 없이 받아들이므로, 호출 측에서도 이미 배열이 있으면 리스트로 바꾸지 말고
+그대로 넘기는 편이 복사가 적다.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
-import networkx as nx
-import pandas as pd
-from typing import List, Dict
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Sequence, Union
 import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 수치 커널 JIT 컴파일 (numba가 없으면 같은 코드를 NumPy로 실행)
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# 산업 분야별 색상 (모듈 로드 시 한 번만 생성)
+_COLORS = MappingProxyType({
+    "AI/빅데이터": "#1f77b4",
+    "바이오헬스": "#2ca02c",
+    "친환경에너지": "#90EE90",
+    "메타버스/XR": "#9467bd",
+    "자율주행/모빌리티": "#8c564b",
+    "로봇공학": "#e377c2",
+    "우주항공": "#17becf",
+    "스마트시티": "#bcbd22"
+})
+
+# 색상이 정해지지 않은 분야에 쓰는 회색
+_FALLBACK_COLOR = '#7f7f7f'
+
+# 연봉 범위 형식 ("3,000만원 ~ 5,000만원")
+_SALARY_RE = re.compile(r'\s*(\d[\d,]*)\s*(?:만원)?\s*~\s*(\d[\d,]*)\s*(?:만원)?\s*')
+_DEFAULT_SALARY_RANGE = '3,000만원 ~ 5,000만원'
+
+# 성장 전망 등급 → 지수
+_GROWTH_MAPPING = MappingProxyType({
+    "매우 높음": 5,
+    "높음": 4,
+    "중상": 3,
+    "중": 2,
+    "낮음": 1
+})
+
+# 필요 역량 분류 (차트 축 순서)
+_SKILL_CATEGORIES = ('프로그래밍', '데이터분석', '이론/학문', '도구/툴', '소프트스킬')
+
+# 분류별 키워드 패턴 (_SKILL_CATEGORIES 순서, 처음 일치하는 분류에 집계하고 없으면 소프트스킬)
+_SKILL_PATTERNS = tuple(
+    re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for keywords in (
+        ('python', 'java', 'c++', '프로그래밍'),
+        ('데이터', 'data', '분석', 'analysis'),
+        ('이론', '수학', '통계', '물리', '화학'),
+        ('cad', 'tool', '툴', 'tensorflow', 'pytorch'),
+    )
+)
+_SKILL_FALLBACK_INDEX = len(_SKILL_CATEGORIES) - 1
+
+# 비교 레이더 항목별 정규화 계수 (전망, 성장률, 취업률, 연봉, 학력요구)
+_RADAR_SCALES = np.array([1, 1 / 5, 1 / 20, 1 / 1500, 1], dtype=np.float32)
+
+# 점마다 값을 가질 수 있는 트레이스 속성 (창 크기를 넘으면 함께 잘라냄)
+_PER_POINT_PROPS = ('x', 'y', 'text', 'hovertext', 'customdata', 'ids',
+                    'marker.color', 'marker.size', 'marker.symbol', 'marker.opacity')
+
+# 차트 빌더별 캐시 크기
+FIGURE_CACHE_SIZE = 128
+
+# 직업 전망 등급 → 비교 점수
+_OUTLOOK_SCORES = MappingProxyType({"매우 높음": 5, "높음": 4, "중상": 3, "중": 2, "낮음": 1})
+
+
+def _top_n_indices(values: np.ndarray, n: int) -> np.ndarray:
+    """
+    값이 큰 순서로 n개를 고른 인덱스 (원래 순서 유지)
+    
+    직업 수가 많아도 전체 정렬 없이 np.partition으로 n번째 값만 찾아 O(N)에 고른다.
+    n번째 값과 같은 값이 여럿이면 앞에 있는 직업부터 남긴다.
+    
+    Args:
+        values: 직업별 값 배열
+        n: 남길 개수
+        
+    Returns:
+        선택된 인덱스 배열 (오름차순)
+    """
+    values = np.asarray(values)
+    total = len(values)
+    if n >= total:
+        return np.arange(total)
+    if n <= 0:
+        return np.arange(0)
+    
+    threshold = np.partition(values, total - n)[total - n]
+    above = np.flatnonzero(values > threshold)
+    ties = np.flatnonzero(values == threshold)[:n - len(above)]
+    return np.sort(np.concatenate([above, ties]))
+
+
+@njit(cache=True)
+def _count_categories(indices: np.ndarray, n_categories: int) -> np.ndarray:
+    """
+    분류 번호별 개수 집계
+    
+    Args:
+        indices: 항목별 분류 번호 배열 (int64)
+        n_categories: 분류 개수
+        
+    Returns:
+        분류별 개수 배열 (int32)
+    """
+    return np.bincount(indices, minlength=n_categories).astype(np.int32)
+
+
+@njit(cache=True)
+def _scale_scores(features: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """
+    항목별 계수를 곱해 점수 정규화
+    
+    Args:
+        features: (직업 수, 항목 수) 원래 값 행렬 (float32)
+        scales: 항목별 정규화 계수 (float32)
+        
+    Returns:
+        정규화된 점수 행렬
+    """
+    return features * scales
+
 
 class CareerVisualizer:
-    """진로 데이터 시각화 클래스"""
+    """
+    진로 데이터 시각화 클래스
+    
+    모든 차트는 layout.uirevision을 지정한다. 같은 값으로 다시 그리면
+    브라우저의 Plotly가 차트를 새로 만들지 않고 바뀐 데이터만 반영하며
+    확대/이동 상태도 유지한다. (데이터가 정해진 차트는 차트 이름,
+    대상이 바뀌는 차트는 대상 직업 기준)
+    
+    산업 개요, 성장 전망, 필요 역량, 진로 경로 차트는 입력값만으로 결정되므로
+    입력을 튜플로 바꿔 LRU 캐시에서 꺼낸다. 같은 입력이면 같은 Figure 객체를
+    돌려주므로 호출 측에서 수정하려면 go.Figure(fig)로 복사해서 사용한다.
+    """
     
     def __init__(self):
-        self.colors = {
-            "AI/빅데이터": "#1f77b4",
-            "바이오헬스": "#2ca02c",
-            "친환경에너지": "#90EE90",
-            "메타버스/XR": "#9467bd",
-            "자율주행/모빌리티": "#8c564b",
-            "로봇공학": "#e377c2",
-            "우주항공": "#17becf",
-            "스마트시티": "#bcbd22"
-        }
+        self.colors = _COLORS
+        # 인스턴스별 차트 캐시 (키: 튜플로 바꾼 입력값)
+        self._industry_overview = lru_cache(maxsize=FIGURE_CACHE_SIZE)(self._build_industry_overview)
+        self._industry_overview_json = lru_cache(maxsize=FIGURE_CACHE_SIZE)(self._build_industry_overview_json)
+        self._growth_comparison = lru_cache(maxsize=FIGURE_CACHE_SIZE)(self._build_growth_comparison)
+        self._career_path_network = lru_cache(maxsize=FIGURE_CACHE_SIZE)(self._build_career_path_network)
+        self._skill_requirement_chart = lru_cache(maxsize=FIGURE_CACHE_SIZE)(self._build_skill_requirement_chart)
     
-    def create_industry_overview(self, industries_data: Dict) -> go.Figure:
+    def create_industry_overview(self, industries_data: Union[Dict, np.ndarray],
+                                 job_counts: Optional[np.ndarray] = None) -> go.Figure:
         """
         신산업 분야 개요 차트 생성
         
         Args:
-            industries_data: 산업별 데이터 딕셔너리
+            industries_data: 산업별 데이터 딕셔너리, 또는 산업명 배열 (job_counts와 함께)
+            job_counts: 산업별 직업 수 배열 (산업명 배열을 넘길 때)
+            
+        Returns:
+            Plotly Figure 객체
+        """
+        return self._industry_overview(*self._industry_key(industries_data, job_counts))
+    
+    def create_industry_overview_json(self, industries_data: Union[Dict, np.ndarray],
+                                      job_counts: Optional[np.ndarray] = None) -> str:
+        """
+        신산업 분야 개요 차트를 Plotly JSON 문자열로 반환
+        
+        결국 직렬화해서 보내는 호출 측(Dash, 프런트엔드 등)을 위해 직렬화 결과까지
+        캐시한다. 같은 입력이면 Figure 생성과 직렬화를 모두 건너뛴다.
+        
+        Args:
+            industries_data: 산업별 데이터 딕셔너리, 또는 산업명 배열 (job_counts와 함께)
+            job_counts: 산업별 직업 수 배열 (산업명 배열을 넘길 때)
+            
+        Returns:
+            Plotly Figure JSON 문자열
+        """
+        return self._industry_overview_json(*self._industry_key(industries_data, job_counts))
+    
+    @staticmethod
+    def _industry_key(industries_data: Union[Dict, np.ndarray],
+                      job_counts: Optional[np.ndarray]) -> tuple:
+        """
+        산업 개요 입력을 캐시 키로 쓸 (산업명 튜플, 직업 수 튜플)로 변환
+        
+        Args:
+            industries_data: 산업별 데이터 딕셔너리, 또는 산업명 배열
+            job_counts: 산업별 직업 수 배열
+            
+        Returns:
+            (산업명 튜플, 직업 수 튜플)
+        """
+        if job_counts is None:
+            industries = tuple(industries_data)
+            counts = tuple(int(data['jobs_count']) for data in industries_data.values())
+        else:
+            industries = tuple(np.asarray(industries_data, dtype=object).tolist())
+            counts = tuple(np.asarray(job_counts, dtype=np.int32).tolist())
+        return industries, counts
+    
+    def _build_industry_overview_json(self, industries: tuple, counts: tuple) -> str:
+        """
+        산업 개요 차트 직렬화 (캐시 대상)
+        
+        Args:
+            industries: 산업명 튜플
+            counts: 산업별 직업 수 튜플
+            
+        Returns:
+            Plotly Figure JSON 문자열
+        """
+        return self._industry_overview(industries, counts).to_json()
+    
+    def _build_industry_overview(self, industries: tuple, counts: tuple) -> go.Figure:
+        """
+        산업 개요 차트 생성 (캐시 대상)
+        
+        Args:
+            industries: 산업명 튜플
+            counts: 산업별 직업 수 튜플
             
         Returns:
             Plotly Figure 객체
         """
-        industries = list(industries_data.keys())
-        job_counts = [data['jobs_count'] for data in industries_data.values()]
+        import pandas as pd
         
-        fig = go.Figure(data=[
+        industries = np.asarray(industries, dtype=object)
+        job_counts = np.asarray(counts, dtype=np.int32)
+        # 분야별 색상을 한 번에 매핑 (없는 분야는 회색)
+        colors = pd.Series(industries).map(self.colors).fillna(_FALLBACK_COLOR).to_numpy()
+        
+        data = [
             go.Bar(
                 x=industries,
                 y=job_counts,
                 marker=dict(
-                    color=[self.colors.get(ind, '#gray') for ind in industries],
+                    color=colors,
                     line=dict(color='white', width=2)
                 ),
                 text=job_counts,
                 textposition='outside',
                 hovertemplate='<b>%{x}</b><br>관련 직업: %{y}개<extra></extra>'
             )
-        ])
+        ]
         
-        fig.update_layout(
+        layout = dict(
             title={
                 'text': '신산업 분야별 등록 직업 수',
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 20, 'color': '#2c3e50'}
             },
-            xaxis_title='신산업 분야',
-            yaxis_title='직업 수',
+            xaxis=dict(title='신산업 분야', showgrid=False),
+            yaxis=dict(title='직업 수', showgrid=True, gridcolor='lightgray'),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             height=400,
             showlegend=False,
             font=dict(size=12),
-            hovermode='x'
+            hovermode='x',
+            uirevision='industry_overview'
         )
         
-        fig.update_xaxes(showgrid=False)
-        fig.update_yaxes(showgrid=True, gridcolor='lightgray')
-        
-        return fig
+        return go.Figure(data=data, layout=layout)
     
-    def create_growth_comparison(self, jobs_data: List[Dict]) -> go.Figure:
+    def create_growth_comparison(self, jobs_data: List[Dict], max_points: int = 1000,
+                                 use_webgl: bool = True) -> go.Figure:
         """
         직업별 성장 전망 비교 차트
         
         Args:
             jobs_data: 직업 데이터 리스트
+            max_points: 표시할 최대 직업 수 (초과 시 성장 전망이 높은 직업만 표시하고 제목에 표기)
+            use_webgl: True면 WebGL(Scattergl)로 그림. 일부 SVG 마커 기능이 빠지므로
+                       직업 수가 적고 선명도가 중요하면 False(SVG Scatter)
             
         Returns:
             Plotly Figure 객체
         """
-        growth_mapping = {
-            "매우 높음": 5,
-            "높음": 4,
-            "중상": 3,
-            "중": 2,
-            "낮음": 1
-        }
-        
-        job_names = [job['name'] for job in jobs_data]
-        growth_values = [growth_mapping.get(job['growth'], 0) for job in jobs_data]
-        growth_labels = [job['growth'] for job in jobs_data]
+        jobs = tuple((job['name'], job['growth']) for job in jobs_data)
+        return self._growth_comparison(jobs, max_points, use_webgl)
+    
+    def _build_growth_comparison(self, jobs: tuple, max_points: int, use_webgl: bool) -> go.Figure:
+        """
+        성장 전망 비교 차트 생성 (캐시 대상)
         
-        fig = go.Figure(data=[
-            go.Scatter(
+        Args:
+            jobs: (직업명, 성장 전망) 튜플의 튜플
+            max_points: 표시할 최대 직업 수
+            use_webgl: WebGL(Scattergl) 사용 여부
+            
+        Returns:
+            Plotly Figure 객체
+        """
+        scatter_cls = go.Scattergl if use_webgl else go.Scatter
+        job_names = np.array([name for name, _ in jobs], dtype=object)
+        growth_values = np.fromiter((_GROWTH_MAPPING.get(growth, 0) for _, growth in jobs), dtype=np.int8, count=len(jobs))
+        growth_labels = np.array([growth for _, growth in jobs], dtype=object)
+        
+        # 직업 수가 많으면 성장 전망이 높은 직업만 남기고 제목에 표기
+        # (직업별 항목이므로 임의로 솎아내지 않음)
+        title = '직업별 성장 전망'
+        total = len(job_names)
+        if total > max_points:
+            keep = _top_n_indices(growth_values, max_points)
+            job_names = job_names[keep]
+            growth_values = growth_values[keep]
+            growth_labels = growth_labels[keep]
+            title += f' (상위 {max_points}개 / 전체 {total}개)'
+        
+        data = [
+            scatter_cls(
                 x=job_names,
                 y=growth_values,
                 mode='markers+lines',
@@ -113,30 +341,126 @@ class CareerVisualizer:
                 text=growth_labels,
                 hovertemplate='<b>%{x}</b><br>성장 전망: %{text}<extra></extra>'
             )
-        ])
+        ]
         
-        fig.update_layout(
+        layout = dict(
             title={
-                'text': '직업별 성장 전망',
+                'text': title,
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 18}
             },
-            xaxis_title='직업',
-            yaxis_title='성장 전망 지수',
+            xaxis=dict(title='직업'),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             height=400,
             yaxis=dict(
+                title='성장 전망 지수',
                 tickmode='array',
                 tickvals=[1, 2, 3, 4, 5],
                 ticktext=['낮음', '중', '중상', '높음', '매우 높음']
-            )
+            ),
+            uirevision='growth_comparison'
         )
         
-        return fig
+        return go.Figure(data=data, layout=layout)
     
-    def create_job_comparison_radar(self, comparison_df: pd.DataFrame) -> go.Figure:
+    def extend_trace(self, fig: go.Figure, trace_index: int, updates: Dict[str, Sequence],
+                     max_points: Optional[int] = None) -> None:
+        """
+        기존 트레이스 끝에 데이터 추가 (Plotly.extendTraces와 같은 방식)
+        
+        Figure를 다시 만들지 않고 바뀐 속성만 갱신한다. FigureWidget이면 추가분만
+        브라우저로 전송된다. 캐시된 Figure는 공유되므로 go.Figure(fig)로 복사한 뒤 사용한다.
+        
+        점별 속성 중 새 점 수보다 짧은 배열은 길이를 맞춰 채운다. 마커 스타일은 마지막 값을
+        반복하고 텍스트/데이터는 None으로 채운다. 그래서 x/y만 추가해도 이후 잘라낼 때
+        점과 색상/텍스트의 짝이 어긋나지 않는다.
+        
+        Args:
+            fig: 갱신할 Figure (또는 FigureWidget)
+            trace_index: 트레이스 번호
+            updates: 속성 경로 → 추가할 값 목록 (예: {'x': [...], 'marker.color': [...]})
+            max_points: 남길 최대 점 개수 (초과하면 오래된 점부터 제거, 없으면 제한 없음)
+        """
+        trace = fig.data[trace_index]
+        merged = {}
+        for prop, new_values in updates.items():
+            current = trace[prop]
+            merged[prop] = np.concatenate([
+                np.asarray(current if current is not None else ()),
+                np.asarray(new_values)
+            ])
+        
+        points = merged['x'] if 'x' in merged else trace.x
+        if points is None:
+            points = merged['y'] if 'y' in merged else trace.y
+        n_points = len(points) if points is not None else 0
+        
+        for prop in _PER_POINT_PROPS:
+            values = merged.get(prop, trace[prop] if prop in trace else None)
+            # 하나의 값으로 지정된 속성(단색 등)과 빈 배열은 그대로 둠
+            if values is None or isinstance(values, str) or np.ndim(values) == 0 or len(values) == 0:
+                continue
+            values = np.asarray(values)
+            changed = prop in merged
+            if len(values) < n_points:
+                padded = np.empty(n_points, dtype=object)
+                padded[:len(values)] = values
+                padded[len(values):] = values[-1] if prop.startswith('marker.') else None
+                values, changed = padded, True
+            if max_points is not None and len(values) > max_points:
+                values, changed = values[-max_points:], True
+            if changed:
+                merged[prop] = values
+        
+        with fig.batch_update():
+            for prop, values in merged.items():
+                trace[prop] = values
+    
+    def append_point(self, fig: go.Figure, trace_index: int, x: Any, y: float,
+                     max_points: Optional[int] = None, min_distance: float = 0.0) -> bool:
+        """
+        트레이스에 점 하나 추가 (실시간 갱신용)
+        
+        Args:
+            fig: 갱신할 Figure (또는 FigureWidget)
+            trace_index: 트레이스 번호
+            x: 추가할 x 값
+            y: 추가할 y 값
+            max_points: 남길 최대 점 개수 (창 크기, 없으면 제한 없음)
+            min_distance: 직전 점과 y 차이가 이보다 작으면 추가하지 않음
+            
+        Returns:
+            점을 추가했으면 True
+        """
+        last_y = fig.data[trace_index].y
+        if min_distance > 0 and last_y is not None and len(last_y) and abs(y - last_y[-1]) < min_distance:
+            return False
+        
+        self.extend_trace(fig, trace_index, {'x': [x], 'y': [y]}, max_points)
+        return True
+    
+    def extend_growth_comparison(self, fig: go.Figure, new_jobs: List[Dict],
+                                 max_points: Optional[int] = None) -> None:
+        """
+        성장 전망 비교 차트에 직업 추가 (차트를 다시 만들지 않음)
+        
+        Args:
+            fig: create_growth_comparison으로 만든 Figure의 복사본
+            new_jobs: 추가할 직업 데이터 리스트
+            max_points: 남길 최대 직업 수 (초과하면 앞쪽 직업부터 제거)
+        """
+        growth_values = np.fromiter((_GROWTH_MAPPING.get(job['growth'], 0) for job in new_jobs),
+                                    dtype=np.int8, count=len(new_jobs))
+        self.extend_trace(fig, 0, {
+            'x': np.array([job['name'] for job in new_jobs], dtype=object),
+            'y': growth_values,
+            'marker.color': growth_values,
+            'text': np.array([job['growth'] for job in new_jobs], dtype=object),
+        }, max_points)
+    
+    def create_job_comparison_radar(self, comparison_df: "pd.DataFrame") -> go.Figure:
         """
         직업 비교 레이더 차트
         
@@ -146,42 +470,45 @@ class CareerVisualizer:
         Returns:
             Plotly Figure 객체
         """
-        # 점수 매핑
-        outlook_scores = {"매우 높음": 5, "높음": 4, "중상": 3, "중": 2, "낮음": 1}
+        import pandas as pd
         
         categories = ['전망', '성장률', '취업률', '연봉', '학력요구']
         
-        fig = go.Figure()
+        df = comparison_df
         
-        for idx, row in comparison_df.iterrows():
-            # 각 항목을 점수화
-            outlook = outlook_scores.get(row.get('전망', '중'), 3)
-            growth = float(row.get('성장률', '10%').rstrip('%')) / 5  # 정규화
-            employment = float(row.get('취업률', '50%').rstrip('%')) / 20  # 정규화
-            
-            # 연봉 중간값 추출
-            salary_str = row.get('연봉범위', '3,000만원 ~ 5,000만원')
-            try:
-                salaries = [int(s.replace('만원', '').replace(',', '').strip()) 
-                           for s in salary_str.split('~')]
-                salary_score = (sum(salaries) / len(salaries)) / 1500  # 정규화
-            except:
-                salary_score = 3
-            
-            # 학력 요구도 (높을수록 점수 낮음)
-            education = 5 if '고졸' in row.get('학력요구', '') else \
-                       4 if '학사' in row.get('학력요구', '') else 3
-            
-            values = [outlook, growth, employment, salary_score, education]
-            
-            fig.add_trace(go.Scatterpolar(
+        def column(name: str, default: str) -> pd.Series:
+            # 항목이 없으면 기본값으로 채운 열 사용
+            return df[name] if name in df else pd.Series(default, index=df.index, dtype=object)
+        
+        # 각 항목의 원래 값을 열 단위로 추출
+        outlook = column('전망', '중').map(_OUTLOOK_SCORES).fillna(3)
+        growth = column('성장률', '10%').str.rstrip('%').astype(float)
+        employment = column('취업률', '50%').str.rstrip('%').astype(float)
+        
+        # 연봉 중간값 (형식이 다르면 3점이 되도록 채움)
+        salary_range = column('연봉범위', _DEFAULT_SALARY_RANGE).str.extract(_SALARY_RE)
+        salary_mid = salary_range.replace(',', '', regex=True).astype(float).mean(axis=1).fillna(3 / _RADAR_SCALES[3])
+        
+        # 학력 요구도 (높을수록 점수 낮음)
+        education_req = column('학력요구', '').fillna('')
+        education = np.where(education_req.str.contains('고졸', regex=False), 5,
+                             np.where(education_req.str.contains('학사', regex=False), 4, 3))
+        
+        # 항목별 계수를 한 번에 곱해 정규화
+        features = np.column_stack([outlook, growth, employment, salary_mid, education]).astype(np.float32)
+        scores = _scale_scores(features, _RADAR_SCALES)
+        
+        data = [
+            go.Scatterpolar(
                 r=values,
                 theta=categories,
                 fill='toself',
-                name=row['직업명']
-            ))
+                name=name
+            )
+            for name, values in zip(df['직업명'], scores)
+        ]
         
-        fig.update_layout(
+        layout = dict(
             polar=dict(
                 radialaxis=dict(
                     visible=True,
@@ -194,10 +521,11 @@ class CareerVisualizer:
                 'x': 0.5,
                 'xanchor': 'center'
             },
-            height=500
+            height=500,
+            uirevision='comparison_radar'
         )
         
-        return fig
+        return go.Figure(data=data, layout=layout)
     
     def create_career_path_network(self, path_data: Dict) -> go.Figure:
         """
@@ -209,33 +537,30 @@ class CareerVisualizer:
         Returns:
             Plotly Figure 객체
         """
-        G = nx.DiGraph()
-        
-        steps = path_data.get('steps', [])
-        
-        # 노드 추가
-        for i, step in enumerate(steps):
-            G.add_node(i, label=step, level=i)
+        return self._career_path_network(path_data.get('job_name'), tuple(path_data.get('steps', [])))
+    
+    def _build_career_path_network(self, job_name: Optional[str], steps: tuple) -> go.Figure:
+        """
+        진로 경로 그래프 생성 (캐시 대상)
         
-        # 엣지 추가
-        for i in range(len(steps) - 1):
-            G.add_edge(i, i + 1)
+        Args:
+            job_name: 직업명
+            steps: 진로 단계 튜플
+            
+        Returns:
+            Plotly Figure 객체
+        """
+        n = len(steps)
         
-        # 위치 계산 (계층적 레이아웃)
-        pos = {}
-        for i, step in enumerate(steps):
-            pos[i] = (i, 0)
+        # 위치 계산 (단계 순서대로 한 줄에 배치: 0 → 1 → ... → n-1)
+        pos_x = np.arange(n, dtype=float)
+        pos_y = np.zeros(n)
         
-        # 엣지 좌표
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
+        # 엣지 좌표 (i → i+1 구간을 None으로 끊어 이어 붙임)
+        edge_x = [v for i in range(n - 1) for v in (i, i + 1, None)]
+        edge_y = [0, 0, None] * (n - 1)
         
-        edge_trace = go.Scatter(
+        edge_trace = go.Scattergl(
             x=edge_x, y=edge_y,
             line=dict(width=3, color='#888'),
             hoverinfo='none',
@@ -243,27 +568,15 @@ class CareerVisualizer:
             showlegend=False
         )
         
-        # 노드 좌표
-        node_x = []
-        node_y = []
-        node_text = []
-        node_colors = []
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            node_text.append(G.nodes[node]['label'])
-            # 시작은 초록, 끝은 빨강, 중간은 파랑
-            if node == 0:
-                node_colors.append('#2ecc71')
-            elif node == len(steps) - 1:
-                node_colors.append('#e74c3c')
-            else:
-                node_colors.append('#3498db')
-        
-        node_trace = go.Scatter(
-            x=node_x, y=node_y,
+        # 노드 텍스트와 색상 (시작은 초록, 끝은 빨강, 중간은 파랑)
+        node_text = list(steps)
+        if n > 1:
+            node_colors = ['#2ecc71'] + ['#3498db'] * (n - 2) + ['#e74c3c']
+        else:
+            node_colors = ['#2ecc71'] * n
+        
+        node_trace = go.Scattergl(
+            x=pos_x, y=pos_y,
             mode='markers+text',
             hoverinfo='text',
             text=node_text,
@@ -279,13 +592,11 @@ class CareerVisualizer:
         
         # 화살표 추가
         annotations = []
-        for i in range(len(steps) - 1):
-            x0, y0 = pos[i]
-            x1, y1 = pos[i + 1]
+        for i in range(n - 1):
             annotations.append(
                 dict(
-                    x=x1, y=y1,
-                    ax=x0, ay=y0,
+                    x=pos_x[i + 1], y=pos_y[i + 1],
+                    ax=pos_x[i], ay=pos_y[i],
                     xref='x', yref='y',
                     axref='x', ayref='y',
                     showarrow=True,
@@ -296,11 +607,9 @@ class CareerVisualizer:
                 )
             )
         
-        fig = go.Figure(data=[edge_trace, node_trace])
-        
-        fig.update_layout(
+        layout = dict(
             title={
-                'text': f"{path_data.get('job_name', '직업')} 진로 경로",
+                'text': f"{job_name or '직업'} 진로 경로",
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 20}
@@ -313,55 +622,78 @@ class CareerVisualizer:
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
             annotations=annotations,
-            margin=dict(t=80, b=20, l=20, r=20)
+            margin=dict(t=80, b=20, l=20, r=20),
+            transition_duration=0,
+            # 같은 직업이면 확대/이동 상태 유지
+            uirevision=job_name or ''
         )
         
-        return fig
+        return go.Figure(data=[edge_trace, node_trace], layout=layout)
     
-    def create_salary_distribution(self, jobs_data: List[Dict]) -> go.Figure:
+    def create_salary_distribution(self, jobs_data: List[Dict], max_points: int = 500,
+                                   use_webgl: bool = True) -> go.Figure:
         """
         직업별 연봉 분포 차트
         
         Args:
             jobs_data: 직업 상세 정보 리스트
+            max_points: 표시할 최대 직업 수 (초과 시 평균 연봉이 높은 직업만 표시하고 제목에 표기)
+            use_webgl: True면 WebGL(Scattergl)로 그림. 일부 SVG 마커 기능이 빠지므로
+                       직업 수가 적고 선명도가 중요하면 False(SVG Scatter)
             
         Returns:
             Plotly Figure 객체
         """
-        job_names = []
-        min_salaries = []
-        max_salaries = []
-        avg_salaries = []
-        
-        for job in jobs_data:
-            salary_range = job.get('salary_range', '3,000만원 ~ 5,000만원')
-            try:
-                parts = salary_range.split('~')
-                min_sal = int(parts[0].replace('만원', '').replace(',', '').strip())
-                max_sal = int(parts[1].replace('만원', '').replace(',', '').strip())
-                
-                job_names.append(job.get('job_name', ''))
-                min_salaries.append(min_sal)
-                max_salaries.append(max_sal)
-                avg_salaries.append((min_sal + max_sal) / 2)
-            except:
-                continue
-        
-        fig = go.Figure()
-        
-        # 범위 표시
-        for i, job_name in enumerate(job_names):
-            fig.add_trace(go.Scatter(
-                x=[min_salaries[i], max_salaries[i]],
-                y=[job_name, job_name],
-                mode='lines',
-                line=dict(color='lightblue', width=10),
-                showlegend=False,
-                hoverinfo='skip'
-            ))
+        scatter_cls = go.Scattergl if use_webgl else go.Scatter
+        
+        # 연봉 범위에서 최소/최대 금액을 한 번에 추출 (값이 없거나 형식이 다르면 제외)
+        salaries = ((job.get('job_name', ''), job.get('salary_range', _DEFAULT_SALARY_RANGE)) for job in jobs_data)
+        parsed = [
+            (name, match) for name, salary in salaries
+            if isinstance(salary, str) and (match := _SALARY_RE.fullmatch(salary))
+        ]
+        
+        job_names = np.array([name for name, _ in parsed], dtype=object)
+        min_salaries = np.fromiter(
+            (int(match.group(1).replace(',', '')) for _, match in parsed),
+            dtype=np.int64, count=len(parsed)
+        )
+        max_salaries = np.fromiter(
+            (int(match.group(2).replace(',', '')) for _, match in parsed),
+            dtype=np.int64, count=len(parsed)
+        )
+        avg_salaries = (min_salaries + max_salaries) * 0.5
+        
+        # 직업 수가 많으면 평균 연봉이 높은 직업만 남기고 제목에 표기
+        title = '직업별 연봉 분포'
+        total = len(job_names)
+        if total > max_points:
+            keep = _top_n_indices(avg_salaries, max_points)
+            job_names = job_names[keep]
+            min_salaries = min_salaries[keep]
+            max_salaries = max_salaries[keep]
+            avg_salaries = avg_salaries[keep]
+            title += f' (상위 {max_points}개 / 전체 {total}개)'
+        
+        # 범위 표시 (직업별 구간을 None으로 끊어 하나의 선으로)
+        range_x = np.empty(len(job_names) * 3, dtype=object)
+        range_x[0::3] = min_salaries
+        range_x[1::3] = max_salaries
+        range_y = np.repeat(job_names, 3)
+        range_y[2::3] = None
+        
+        range_trace = scatter_cls(
+            x=range_x,
+            y=range_y,
+            mode='lines',
+            line=dict(color='lightblue', width=10),
+            connectgaps=False,
+            showlegend=False,
+            hoverinfo='skip'
+        )
         
         # 평균 표시
-        fig.add_trace(go.Scatter(
+        mean_trace = scatter_cls(
             x=avg_salaries,
             y=job_names,
             mode='markers',
@@ -373,26 +705,26 @@ class CareerVisualizer:
             ),
             name='평균 연봉',
             hovertemplate='<b>%{y}</b><br>평균 연봉: %{x:,.0f}만원<extra></extra>'
-        ))
+        )
         
-        fig.update_layout(
+        layout = dict(
             title={
-                'text': '직업별 연봉 분포',
+                'text': title,
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 18}
             },
-            xaxis_title='연봉 (만원)',
-            yaxis_title='',
+            xaxis=dict(title='연봉 (만원)', showgrid=True, gridcolor='lightgray'),
+            yaxis=dict(title=''),
             height=max(400, len(job_names) * 50),
             plot_bgcolor='rgba(0,0,0,0)',
             paper_bgcolor='rgba(0,0,0,0)',
-            hovermode='closest'
+            hovermode='closest',
+            # 같은 직업 조합이면 확대/이동 상태 유지
+            uirevision='|'.join(job_names)
         )
         
-        fig.update_xaxis(showgrid=True, gridcolor='lightgray')
-        
-        return fig
+        return go.Figure(data=[range_trace, mean_trace], layout=layout)
     
     def create_skill_requirement_chart(self, job_data: Dict) -> go.Figure:
         """
@@ -404,60 +736,57 @@ class CareerVisualizer:
         Returns:
             Plotly Figure 객체
         """
-        skills = job_data.get('required_skills', [])
-        
-        # 스킬을 카테고리로 분류
-        skill_categories = {
-            '프로그래밍': 0,
-            '데이터분석': 0,
-            '이론/학문': 0,
-            '도구/툴': 0,
-            '소프트스킬': 0
-        }
-        
-        for skill in skills:
-            skill_lower = skill.lower()
-            if any(lang in skill_lower for lang in ['python', 'java', 'c++', '프로그래밍']):
-                skill_categories['프로그래밍'] += 1
-            elif any(term in skill_lower for term in ['데이터', 'data', '분석', 'analysis']):
-                skill_categories['데이터분석'] += 1
-            elif any(term in skill_lower for term in ['이론', '수학', '통계', '물리', '화학']):
-                skill_categories['이론/학문'] += 1
-            elif any(term in skill_lower for term in ['cad', 'tool', '툴', 'tensorflow', 'pytorch']):
-                skill_categories['도구/툴'] += 1
-            else:
-                skill_categories['소프트스킬'] += 1
-        
-        categories = list(skill_categories.keys())
-        values = list(skill_categories.values())
-        
-        fig = go.Figure(data=[
+        return self._skill_requirement_chart(job_data.get('job_name'), tuple(job_data.get('required_skills', [])))
+    
+    def _build_skill_requirement_chart(self, job_name: Optional[str], skills: tuple) -> go.Figure:
+        """
+        필요 역량 차트 생성 (캐시 대상)
+        
+        Args:
+            job_name: 직업명
+            skills: 필요 역량 튜플
+            
+        Returns:
+            Plotly Figure 객체
+        """
+        # 스킬을 카테고리로 분류 (정규식 검사는 파이썬에서, 카테고리 순서대로 개수 집계는 수치 커널에서)
+        indices = np.fromiter(
+            (next((i for i, pattern in enumerate(_SKILL_PATTERNS) if pattern.search(skill)), _SKILL_FALLBACK_INDEX)
+             for skill in skills),
+            dtype=np.int64, count=len(skills)
+        )
+        values = _count_categories(indices, len(_SKILL_CATEGORIES))
+        
+        max_count = int(values.max())
+        
+        data = [
             go.Scatterpolar(
                 r=values,
-                theta=categories,
+                theta=_SKILL_CATEGORIES,
                 fill='toself',
                 marker=dict(color='#1f77b4'),
                 line=dict(color='#1f77b4', width=2)
             )
-        ])
+        ]
         
-        fig.update_layout(
+        layout = dict(
             polar=dict(
                 radialaxis=dict(
                     visible=True,
-                    range=[0, max(values) + 1] if max(values) > 0 else [0, 5]
+                    range=[0, max_count + 1] if max_count else [0, 5]
                 )
             ),
             showlegend=False,
             title={
-                'text': f"{job_data.get('job_name', '직업')} 필요 역량",
+                'text': f"{job_name or '직업'} 필요 역량",
                 'x': 0.5,
                 'xanchor': 'center'
             },
-            height=400
+            height=400,
+            uirevision=job_name or ''
         )
         
-        return fig
+        return go.Figure(data=data, layout=layout)
 
 
 if __name__ == "__main__":